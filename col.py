@@ -17,6 +17,8 @@ class Column:
     """
     Represents a column in a dataset, including its name, data type, nullability, and distribution.
     """
+    __slots__ = ("name", "type", "nullability", "dist")
+
     def __init__(
         self, name: str, type: DataType, nullability: float, dist: Distribution
     ):
@@ -1,14 +1,38 @@
 from abc import ABC, abstractmethod
+import bisect
+from functools import lru_cache
+import itertools
 import random
 import math
 import string
 
+import numpy as np
+
+_rng = np.random.default_rng()
+
+_ALPHABET = string.ascii_letters + string.digits
+_ALPHABET_BYTES = np.frombuffer(_ALPHABET.encode("ascii"), dtype=np.uint8)
+
+# Distribution types whose instances carry no per-value state and can be shared
+# between columns declaring an identical `dist` config.
+_SHAREABLE_TYPES = {
+    "random",
+    "random_int",
+    "normal",
+    "uniform",
+    "constant_string",
+    "constant_int",
+    "constant_float",
+}
+
 
 class Distribution(ABC):
     """
     Abstract base class for distributions. Defines the structure for distribution classes.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self):
         pass
@@ -22,6 +46,17 @@ class Distribution(ABC):
     def generator(self):
         pass
 
+    def batches(self, size: int):
+        """
+        Like `generator`, but yields numpy arrays of `size` consecutive values.
+
+        Subclasses override this with a vectorized implementation where possible.
+        """
+        values = self.generator()
+        while True:
+            # object dtype keeps each value exactly as generator() produced it
+            yield np.fromiter(itertools.islice(values, size), dtype=object, count=size)
+
     def from_config(config: dict):
         """
         Selects the appropriate distribution class based on configuration and returns its instance.
@@ -29,35 +64,27 @@ class Distribution(ABC):
         :param config: A dictionary containing the distribution configuration.
         :return: An instance of a Distribution subclass.
         """
+        if config["type"] in _SHAREABLE_TYPES:
+            # 1, 1.0 and True compare equal, so the key also carries each type
+            key = tuple(sorted((k, type(v), v) for k, v in config.items()))
+            try:
+                return _from_config_cached(key)
+            except TypeError:
+                # unhashable values (e.g. a list) are simply not shared
+                pass
+        return Distribution._build(config)
+
+    def _build(config: dict):
         dist_type = config["type"]
-        if dist_type == "mono_inc":
-            return MonoInc(config["step"])
-        elif dist_type == "mono_dec":
-            return MonoDec(config["step"])
-        elif dist_type == "random":
-            return Random(config["upper_bound"], config["lower_bound"])
-        elif dist_type == "random_int":
-            return RandomInt(config["upper_bound"], config["lower_bound"])
-        elif dist_type == "random_string":
-            return RandomString(config["length"])
-        elif dist_type == "normal":
-            return Normal(config["mean"], config["stddev"])
-        elif dist_type == "uniform":
-            return Uniform(config["upper_bound"], config["lower_bound"])
-        elif dist_type == "noise":
-            return Noise(config["max_fluctuation"])
-        elif dist_type == "periodic":
-            return Periodic(config["period"], config["amplitude"], config["bias"])
-        elif dist_type == "constant_string":
-            return ConstantString(config["value"])
-        elif dist_type == "constant_int":
-            return ConstantInt(config["value"])
-        elif dist_type == "constant_float":
-            return ConstantFloat(config["value"])
-        elif dist_type == "weighted_preset":
-            return WeightedPreset.from_config(config["preset"])
-        else:
+        if dist_type not in _DIST_TYPES:
             raise ValueError(f"Unsupported distribution type: {dist_type}")
+        factory, arg_names = _DIST_TYPES[dist_type]
+        return factory(*(config[name] for name in arg_names))
+
+
+@lru_cache(maxsize=1024)
+def _from_config_cached(key: tuple):
+    return Distribution._build({k: v for k, _, v in key})
 
 
 class MonoInc(Distribution):
@@ -65,6 +92,8 @@ class MonoInc(Distribution):
     Represents a monotonically increasing distribution.
     """
 
+    __slots__ = ("step",)
+
     def __init__(self, step: float):
         self.step = step
 
@@ -74,12 +103,27 @@ class MonoInc(Distribution):
             yield current
             current += self.step
 
+    def batches(self, size: int):
+        # Accumulate one step at a time, as generator() does, so float steps
+        # round identically instead of drifting from exact multiples.
+        steps = np.full(size, self.step)
+        steps[0] = 0
+        # generator() starts at the int 0 even when step is a float
+        values = np.add.accumulate(steps).astype(object)
+        values[0] = 0
+        while True:
+            yield values
+            steps[0] = values[-1] + self.step
+            values = np.add.accumulate(steps)
+
 
 class MonoDec(Distribution):
     """
     Represents a monotonically decreasing distribution.
     """
 
+    __slots__ = ("step",)
+
     def __init__(self, step: float):
         self.step = step
 
@@ -89,12 +133,27 @@ class MonoDec(Distribution):
             yield current
             current -= self.step
 
+    def batches(self, size: int):
+        # Accumulate one step at a time, as generator() does, so float steps
+        # round identically instead of drifting from exact multiples.
+        steps = np.full(size, -self.step)
+        steps[0] = 0
+        # generator() starts at the int 0 even when step is a float
+        values = np.add.accumulate(steps).astype(object)
+        values[0] = 0
+        while True:
+            yield values
+            steps[0] = values[-1] - self.step
+            values = np.add.accumulate(steps)
+
 
 class Random(Distribution):
     """
     Represents a random distribution within specified bounds.
     """
 
+    __slots__ = ("upper_bound", "lower_bound")
+
     def __init__(self, upper_bound: float, lower_bound: float):
         self.upper_bound = upper_bound
         self.lower_bound = lower_bound
@@ -103,8 +162,17 @@ class Random(Distribution):
         while True:
             yield random.uniform(self.lower_bound, self.upper_bound)
 
+    def batches(self, size: int):
+        while True:
+            # random.uniform's a + (b - a) * random(), which accepts lower > upper
+            yield self.lower_bound + (
+                self.upper_bound - self.lower_bound
+            ) * _rng.random(size)
+
 
 class RandomInt(Distribution):
+    __slots__ = ("upper_bound", "lower_bound")
+
     def __init__(self, upper_bound: int, lower_bound: int):
         self.upper_bound = upper_bound
         self.lower_bound = lower_bound
@@ -116,16 +184,32 @@ class RandomInt(Distribution):
         while True:
             yield random.randint(self.lower_bound, self.upper_bound)
 
+    def batches(self, size: int):
+        while True:
+            yield _rng.integers(self.lower_bound, self.upper_bound, size, endpoint=True)
+
 
 class RandomString(Distribution):
+    __slots__ = ("length",)
+
     def __init__(self, length: int):
         self.length = length
 
     def generator(self):
         while True:
-            yield "".join(
-                random.choices(string.ascii_letters + string.digits, k=self.length)
-            )
+            yield "".join(random.choices(_ALPHABET, k=self.length))
+
+    def batches(self, size: int):
+        if self.length == 0:
+            # numpy has no zero-width view to reinterpret the bytes as
+            values = np.full(size, "")
+            while True:
+                yield values
+        dtype = f"S{self.length}"
+        while True:
+            idx = _rng.integers(0, _ALPHABET_BYTES.size, (size, self.length))
+            # Reinterpret each row of sampled bytes as one fixed-width string.
+            yield _ALPHABET_BYTES[idx].view(dtype).ravel().astype(str)
 
 
 class Normal(Distribution):
@@ -133,6 +217,8 @@ class Normal(Distribution):
     Represents a normal (Gaussian) distribution.
     """
 
+    __slots__ = ("mean", "std_dev")
+
     def __init__(self, mean: float, std_dev: float):
         self.mean = mean
         self.std_dev = std_dev
@@ -141,12 +227,19 @@ class Normal(Distribution):
         while True:
             yield random.normalvariate(self.mean, self.std_dev)
 
+    def batches(self, size: int):
+        while True:
+            # like random.normalvariate, a negative std_dev is accepted
+            yield self.mean + self.std_dev * _rng.standard_normal(size)
+
 
 class Uniform(Distribution):
     """
     Represents a uniform distribution within specified bounds.
     """
 
+    __slots__ = ("upper_bound", "lower_bound")
+
     def __init__(self, upper_bound: float, lower_bound: float):
         self.upper_bound = upper_bound
         self.lower_bound = lower_bound
@@ -155,12 +248,21 @@ class Uniform(Distribution):
         while True:
             yield random.uniform(self.lower_bound, self.upper_bound)
 
+    def batches(self, size: int):
+        while True:
+            # random.uniform's a + (b - a) * random(), which accepts lower > upper
+            yield self.lower_bound + (
+                self.upper_bound - self.lower_bound
+            ) * _rng.random(size)
+
 
 class Noise(Distribution):
     """
     Represents a noise distribution with a maximum fluctuation.
     """
 
+    __slots__ = ("max_fluctuation",)
+
     def __init__(self, max_fluctuation: float):
         self.max_fluctuation = max_fluctuation
 
@@ -170,22 +272,42 @@ class Noise(Distribution):
             current += random.uniform(-self.max_fluctuation, self.max_fluctuation)
             yield current
 
+    def batches(self, size: int):
+        current = 0
+        while True:
+            fluctuation = -self.max_fluctuation + (
+                2 * self.max_fluctuation
+            ) * _rng.random(size)
+            values = current + np.cumsum(fluctuation)
+            current = values[-1]
+            yield values
+
 
 class Periodic(Distribution):
     """
     Represents a periodic distribution with specified period, amplitude, and bias.
     """
 
+    __slots__ = ("period", "amplitude", "bias")
+
     def __init__(self, period: float, amplitude: float, bias: float):
         self.period = period
         self.amplitude = amplitude
         self.bias = bias
 
     def generator(self):
-        current = 0
+        t = 0
         while True:
-            current = self.amplitude * math.sin(current / self.period) + self.bias
-            yield current
+            yield self.amplitude * math.sin(2 * math.pi * t / self.period) + self.bias
+            t += 1
+
+    def batches(self, size: int):
+        phase = 2 * np.pi * np.arange(size) / self.period
+        step = 2 * np.pi * size / self.period
+        t = 0
+        while True:
+            yield self.amplitude * np.sin(phase + step * t) + self.bias
+            t += 1
 
 
 class ConstantString(Distribution):
@@ -193,6 +315,8 @@ class ConstantString(Distribution):
     Represents a constant string distribution.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: str):
         self.value = value
 
@@ -203,12 +327,21 @@ class ConstantString(Distribution):
         while True:
             yield self.value
 
+    def batches(self, size: int):
+        # object dtype keeps the configured value as is, whatever its type
+        values = np.empty(size, dtype=object)
+        values.fill(self.value)
+        while True:
+            yield values
+
 
 class ConstantInt(Distribution):
     """
     Represents a constant integer distribution.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: int):
         self.value = value
 
@@ -219,12 +352,21 @@ class ConstantInt(Distribution):
         while True:
             yield self.value
 
+    def batches(self, size: int):
+        # object dtype keeps the configured value as is, whatever its type
+        values = np.empty(size, dtype=object)
+        values.fill(self.value)
+        while True:
+            yield values
+
 
 class ConstantFloat(Distribution):
     """
     Represents a constant floating-point distribution.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: float):
         self.value = value
 
@@ -235,12 +377,21 @@ class ConstantFloat(Distribution):
         while True:
             yield self.value
 
+    def batches(self, size: int):
+        # object dtype keeps the configured value as is, whatever its type
+        values = np.empty(size, dtype=object)
+        values.fill(self.value)
+        while True:
+            yield values
+
 
 class Weight:
     """
     Represents a weighted value for the WeightedPreset distribution.
     """
 
+    __slots__ = ("value", "weight")
+
     def __init__(self, value: str, weight: float):
         self.value = value
         self.weight = weight
@@ -254,8 +405,14 @@ class WeightedPreset(Distribution):
     Represents a weighted preset distribution.
     """
 
+    __slots__ = ("presets", "_values", "_weights", "_cum", "_total")
+
     def __init__(self, presets: list):
         self.presets = presets
+        self._values = tuple(p.value for p in presets)
+        self._weights = tuple(p.weight for p in presets)
+        self._cum = list(itertools.accumulate(self._weights))
+        self._total = self._cum[-1] if self._cum else 0
 
     def all(self) -> list:
         return [p.value for p in self.presets]
@@ -263,8 +420,48 @@ class WeightedPreset(Distribution):
     def from_config(config: list):
         return WeightedPreset([Weight.from_config(p) for p in config])
 
+    def _check_total(self):
+        # Checked only when sampling, like random.choices: tags merely
+        # enumerate their values, so their weights may all be zero.
+        if self._total <= 0:
+            raise ValueError("Total of weights must be greater than zero")
+
     def generator(self):
+        self._check_total()
+        # Inverse-CDF sampling, as random.choices does, without its per-call
+        # argument checks and result list.
+        values, cum, total = self._values, self._cum, self._total
+        _bisect, _random = bisect.bisect, random.random
+        hi = len(cum) - 1
+        while True:
+            yield values[_bisect(cum, _random() * total, 0, hi)]
+
+    def batches(self, size: int):
+        self._check_total()
+        # object dtype keeps each preset's own type instead of a common one
+        values = np.array(self._values, dtype=object)
+        cum = np.array(self._cum, dtype=np.float64)
+        hi = len(cum) - 1
         while True:
-            yield random.choices(
-                [p.value for p in self.presets], [p.weight for p in self.presets]
-            )[0]
+            # the same inverse-CDF lookup as generator(), vectorized
+            idx = np.searchsorted(cum, _rng.random(size) * self._total, side="right")
+            yield values[np.minimum(idx, hi)]
+
+
+# Maps a config `type` to the factory building it and the config keys passed to
+# that factory as positional arguments.
+_DIST_TYPES = {
+    "mono_inc": (MonoInc, ("step",)),
+    "mono_dec": (MonoDec, ("step",)),
+    "random": (Random, ("upper_bound", "lower_bound")),
+    "random_int": (RandomInt, ("upper_bound", "lower_bound")),
+    "random_string": (RandomString, ("length",)),
+    "normal": (Normal, ("mean", "stddev")),
+    "uniform": (Uniform, ("upper_bound", "lower_bound")),
+    "noise": (Noise, ("max_fluctuation",)),
+    "periodic": (Periodic, ("period", "amplitude", "bias")),
+    "constant_string": (ConstantString, ("value",)),
+    "constant_int": (ConstantInt, ("value",)),
+    "constant_float": (ConstantFloat, ("value",)),
+    "weighted_preset": (WeightedPreset.from_config, ("preset",)),
+}
@@ -1,5 +1,4 @@
 import argparse
-import csv
 import yaml
 import itertools
 from functools import reduce
@@ -7,9 +6,18 @@ import random
 from pathlib import Path
 import datetime
 from tqdm import trange
+import numpy as np
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
 
 from col import Column
 
+# Number of timestamps whose values are generated in one batch per series
+TIME_SLICE = 64
+
 # Parse command line arguments and return the parsed result
 def arg_parser():
     """
@@ -25,6 +33,25 @@ def arg_parser():
     parser.add_argument("-c", "--config", default="./config.yaml", help="config file")
     return parser.parse_args()
 
+# Format one value as a CSV field
+def csv_field(value) -> str:
+    """
+    Formats a value the same way csv.writer does with the default dialect.
+
+    Args:
+        value: The value to format.
+
+    Returns:
+        str: The field text, quoted if it contains a delimiter, quote or newline.
+        None becomes an empty field.
+    """
+    if value is None:
+        return ""
+    text = str(value)
+    if "," in text or '"' in text or "\n" in text or "\r" in text:
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
 # Generate permutations of tag sets
 def tag_set_permutation(tags: list):
     """
@@ -34,14 +61,13 @@ def tag_set_permutation(tags: list):
         tags (list): A list of tags to generate permutations for.
 
     Returns:
-        list: A list of dictionaries, each representing a permutation of tag sets.
+        iterator: A lazy iterator of tuples, each holding one tag set's values in
+        the order of `tags`.
     """
-    tag_set = {tag.name: [tag_v for tag_v in tag.dist.all()] for tag in tags}
-    keys, values = zip(*tag_set.items())
+    values = [list(tag.dist.all()) for tag in tags]
     count = reduce(lambda count, i: count * len(i), values, 1)
     print("number of tag combinations:" + str(count))
-    permutation = [dict(zip(keys, v)) for v in itertools.product(*values)]
-    return permutation
+    return itertools.product(*values)
 
 # Generate time-series data based on configuration
 def generate_data(
@@ -65,23 +91,46 @@ def generate_data(
         fields (list): List of field definitions.
         out_dir (str): Output directory for the generated CSV file.
     """
-    with open(out_dir, "w", newline="") as output:
-        writer = csv.writer(output, delimiter=",")
+    with open(out_dir, "w", newline="", buffering=1 << 23) as output:
         # write header
         header = ["ts"] + [t.name for t in tags] + [f.name for f in fields]
-        writer.writerow(header)
-        tags_permutation = tag_set_permutation(tags)
-        series_generator = [
-            [series, dict([[field.name, field.dist.generator()] for field in fields])]
-            for series in tags_permutation
+        output.write(",".join(map(csv_field, header)) + "\r\n")
+        # the tag part of a row is fixed per series, so format it only once
+        tag_templates = [
+            "".join("," + csv_field(v) for v in tag_set)
+            for tag_set in tag_set_permutation(tags)
+        ]
+        if not tag_templates:
+            # no series to generate, the output is just the header
+            return
+        # per field, one batch generator for every series
+        field_batches = [
+            [field.dist.batches(TIME_SLICE) for _ in tag_templates]
+            for field in fields
         ]
-        # write rows
-        for ts in trange(start, end, interval):
-            for series in series_generator:
-                timestamp = ts * precision
-                tag_array = [v for v in series[0].values()]
-                field_array = [next(v) for v in series[1].values()]
-                writer.writerow([timestamp] + tag_array + field_array)
+        timestamps = range(start, end, interval)
+        # write rows, generating values for TIME_SLICE timestamps at a time
+        for idx in trange(len(timestamps)):
+            i = idx % TIME_SLICE
+            if i == 0:
+                # formatted timestamps of this slice, shared by every series
+                slice_ts = [
+                    str(ts * precision) for ts in timestamps[idx : idx + TIME_SLICE]
+                ]
+                # per field, a (series x timestamp) matrix of values
+                values = [
+                    np.stack([next(b) for b in batches]) for batches in field_batches
+                ]
+                # numbers never need quoting, so only other columns are escaped
+                formats = [str if v.dtype.kind in "biuf" else csv_field for v in values]
+            timestamp = slice_ts[i]
+            prefixes = [timestamp + template for template in tag_templates]
+            columns = [
+                list(map(fmt, v[:, i].tolist())) for fmt, v in zip(formats, values)
+            ]
+            output.write(
+                "".join([",".join(row) + "\r\n" for row in zip(prefixes, *columns)])
+            )
 
 # Load yaml file
 def load_yaml(path):
@@ -95,7 +144,7 @@ def load_yaml(path):
         dict: The content of the YAML file.
     """
     with open(path, "r") as file:
-        config = yaml.safe_load(file)
+        config = yaml.load(file, Loader=_Loader)
         return config
 
 # Parse RFC3339 timestamp to UNIX timestamp